@@ -1,16 +1,73 @@
 #!/usr/bin/env python3
 """Generate systems diagram for Sentry-Claude Autofix"""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
-import matplotlib.lines as mlines
+import hashlib
+import sys
+from itertools import chain
+from pathlib import Path
+
+# Each output has a <name>.sha stamp holding the hash of the script that last wrote it.
+# The SVG is always written, so its stamp alone skips the render where cairosvg is missing
+svg_path, png_path = Path('systems-diagram.svg'), Path('systems-diagram.png')
+source_hash = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def stamp(path):
+    return path.with_name(path.name + '.sha')
+
+
+def is_current(path):
+    return (path.exists() and stamp(path).exists()
+            and stamp(path).read_text().strip() == source_hash)
+
+
+svg_current, png_current = is_current(svg_path), is_current(png_path)
+if svg_current and png_current:
+    print(f"✅ Systems diagram up to date: {svg_path}, {png_path}")
+    sys.exit(0)
+
+# Canvas: 14x10 inches at 100 px/inch, drawn over a 10x10 data grid
+WIDTH, HEIGHT = 1400, 1000
+SX, SY = WIDTH / 10, HEIGHT / 10
+PAD = 0.1  # Rounded box padding, in data units
+
+DASHED = ' stroke-dasharray="8,4"'  # Shared by dashed boxes and arrows
+DPI = 150  # PNG is 2100 px wide; flat colours and text need no more than this
+
+
+def px(x, y):
+    """Map data coordinates (origin bottom-left) to SVG pixels."""
+    return x * SX, HEIGHT - y * SY
+
+
+def pt(size):
+    """Convert a point size (font size or line width) to SVG pixels."""
+    return size * 100 / 72
+
+
+def text(x, y, label, size, weight='normal', style='normal', color='#000000',
+         anchor='start', baseline='auto'):
+    cx, cy = px(x, y)
+    label = label.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    # Defaults are left to the SVG renderer so each element only carries its overrides
+    attrs = ''
+    if weight != 'normal':
+        attrs += f' font-weight="{weight}"'
+    if style != 'normal':
+        attrs += f' font-style="{style}"'
+    if color != '#000000':
+        attrs += f' fill="{color}"'
+    if anchor != 'start':
+        attrs += f' text-anchor="{anchor}"'
+    if baseline != 'auto':
+        attrs += f' dominant-baseline="{baseline}"'
+    return f'<text x="{cx:.1f}" y="{cy:.1f}" font-size="{pt(size):.1f}"{attrs}>{label}</text>'
+
+
+def group(name, elements, attrs=''):
+    """Wrap a layer of elements in a single <g> carrying their shared attributes."""
+    return f'<g id="{name}"{attrs}>\n' + '\n'.join(elements) + '\n</g>'
 
-# Set up the figure
-fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-ax.set_xlim(0, 10)
-ax.set_ylim(0, 10)
-ax.axis('off')
 
 # Define colors
 color_external = '#E3F2FD'  # Light blue
@@ -20,191 +77,232 @@ color_orchestrator = '#E8F5E9'  # Light green
 color_claude = '#FFF9C4'    # Light yellow
 color_output = '#FFEBEE'    # Light red
 
-# Title
-ax.text(5, 9.5, 'Sentry-Claude Autofix System Architecture',
-        ha='center', va='top', fontsize=18, fontweight='bold')
-
-# 1. External Services (Top)
-# Sentry.io
-sentry_box = FancyBboxPatch((0.5, 7.5), 2, 1,
-                            boxstyle="round,pad=0.1",
-                            edgecolor='#1976D2', facecolor=color_external, linewidth=2)
-ax.add_patch(sentry_box)
-ax.text(1.5, 8.3, 'Sentry.io', ha='center', va='center', fontsize=11, fontweight='bold')
-ax.text(1.5, 8.0, 'Error Tracking', ha='center', va='center', fontsize=9)
-
-# Claude API
-claude_api_box = FancyBboxPatch((7.5, 7.5), 2, 1,
-                                boxstyle="round,pad=0.1",
-                                edgecolor='#F57C00', facecolor=color_external, linewidth=2)
-ax.add_patch(claude_api_box)
-ax.text(8.5, 8.3, 'Claude API', ha='center', va='center', fontsize=11, fontweight='bold')
-ax.text(8.5, 8.0, 'Anthropic', ha='center', va='center', fontsize=9)
-
-# 2. Sentry Client
-sentry_client = FancyBboxPatch((0.5, 6), 2, 1,
-                               boxstyle="round,pad=0.1",
-                               edgecolor='#E64A19', facecolor=color_client, linewidth=2)
-ax.add_patch(sentry_client)
-ax.text(1.5, 6.7, 'SentryClient', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(1.5, 6.4, 'Fetch Issues', ha='center', va='center', fontsize=8)
-ax.text(1.5, 6.15, '& Events', ha='center', va='center', fontsize=8)
-
-# Arrow: Sentry.io -> SentryClient
-arrow1 = FancyArrowPatch((1.5, 7.5), (1.5, 7.0),
-                        arrowstyle='->', mutation_scale=20, linewidth=2, color='#1976D2')
-ax.add_patch(arrow1)
-ax.text(1.8, 7.25, 'API', fontsize=8)
-
-# 3. Issue Analyzer
-issue_analyzer = FancyBboxPatch((3.5, 6), 2, 1,
-                                boxstyle="round,pad=0.1",
-                                edgecolor='#7B1FA2', facecolor=color_analyzer, linewidth=2)
-ax.add_patch(issue_analyzer)
-ax.text(4.5, 6.7, 'IssueAnalyzer', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(4.5, 6.4, 'Parse Stack', ha='center', va='center', fontsize=8)
-ax.text(4.5, 6.15, 'Traces', ha='center', va='center', fontsize=8)
-
-# Arrow: SentryClient -> IssueAnalyzer
-arrow2 = FancyArrowPatch((2.5, 6.5), (3.5, 6.5),
-                        arrowstyle='->', mutation_scale=20, linewidth=2, color='#7B1FA2')
-ax.add_patch(arrow2)
-ax.text(3.0, 6.7, 'Issues', fontsize=8)
-
-# 4. Orchestrator (Center)
-orchestrator = FancyBboxPatch((3.5, 4.2), 3, 1.2,
-                              boxstyle="round,pad=0.1",
-                              edgecolor='#388E3C', facecolor=color_orchestrator, linewidth=3)
-ax.add_patch(orchestrator)
-ax.text(5, 5.1, 'Orchestrator', ha='center', va='center', fontsize=12, fontweight='bold')
-ax.text(5, 4.8, 'Workflow Coordinator', ha='center', va='center', fontsize=9)
-ax.text(5, 4.5, '• Filter Issues  • Read Files  • Manage Flow',
-        ha='center', va='center', fontsize=7)
-
-# Arrow: IssueAnalyzer -> Orchestrator
-arrow3 = FancyArrowPatch((4.5, 6.0), (4.5, 5.4),
-                        arrowstyle='->', mutation_scale=20, linewidth=2, color='#388E3C')
-ax.add_patch(arrow3)
-ax.text(4.8, 5.7, 'Context', fontsize=8)
-
-# 5. Local Codebase
-codebase = FancyBboxPatch((0.5, 4), 2, 1,
-                         boxstyle="round,pad=0.1",
-                         edgecolor='#455A64', facecolor='#ECEFF1', linewidth=2)
-ax.add_patch(codebase)
-ax.text(1.5, 4.7, 'Local Codebase', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(1.5, 4.4, 'Source Files', ha='center', va='center', fontsize=8)
-
-# Arrow: Orchestrator -> Codebase (read)
-arrow4 = FancyArrowPatch((3.5, 4.8), (2.5, 4.5),
-                        arrowstyle='<-', mutation_scale=20, linewidth=2,
-                        color='#455A64', linestyle='dashed')
-ax.add_patch(arrow4)
-ax.text(2.8, 4.3, 'read', fontsize=8, style='italic')
-
-# 6. Claude Agent
-claude_agent = FancyBboxPatch((7.5, 4.5), 2, 1.5,
-                              boxstyle="round,pad=0.1",
-                              edgecolor='#F57C00', facecolor=color_claude, linewidth=2)
-ax.add_patch(claude_agent)
-ax.text(8.5, 5.6, 'ClaudeAgent', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(8.5, 5.3, 'Build Prompts', ha='center', va='center', fontsize=8)
-ax.text(8.5, 5.05, 'Call Claude API', ha='center', va='center', fontsize=8)
-ax.text(8.5, 4.8, 'Parse Response', ha='center', va='center', fontsize=8)
-
-# Arrow: Orchestrator -> ClaudeAgent
-arrow5 = FancyArrowPatch((6.5, 4.8), (7.5, 5.2),
-                        arrowstyle='->', mutation_scale=20, linewidth=2, color='#F57C00')
-ax.add_patch(arrow5)
-ax.text(6.8, 5.2, 'Context +', fontsize=8)
-ax.text(6.8, 4.95, 'Code', fontsize=8)
-
-# Arrow: ClaudeAgent -> Claude API
-arrow6 = FancyArrowPatch((8.5, 6.0), (8.5, 7.5),
-                        arrowstyle='<->', mutation_scale=20, linewidth=2, color='#F57C00')
-ax.add_patch(arrow6)
-ax.text(8.8, 6.75, 'API', fontsize=8)
-
-# Arrow: ClaudeAgent -> Orchestrator (response)
-arrow7 = FancyArrowPatch((7.5, 4.8), (6.5, 4.8),
-                        arrowstyle='->', mutation_scale=20, linewidth=2,
-                        color='#F57C00', linestyle='dashed')
-ax.add_patch(arrow7)
-ax.text(7.0, 5.0, 'Fix', fontsize=8)
-ax.text(7.0, 4.75, 'Proposal', fontsize=8)
-
-# 7. Output Files
-output_box = FancyBboxPatch((3.5, 2.5), 3, 1,
-                            boxstyle="round,pad=0.1",
-                            edgecolor='#C62828', facecolor=color_output, linewidth=2)
-ax.add_patch(output_box)
-ax.text(5, 3.2, 'Output Files', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(5, 2.9, 'JSON + Markdown Proposals', ha='center', va='center', fontsize=8)
-
-# Arrow: Orchestrator -> Output
-arrow8 = FancyArrowPatch((5, 4.2), (5, 3.5),
-                        arrowstyle='->', mutation_scale=20, linewidth=2, color='#C62828')
-ax.add_patch(arrow8)
-ax.text(5.3, 3.85, 'Save', fontsize=8)
-
-# 8. Sentry Comments (Optional)
-comment_box = FancyBboxPatch((0.5, 2.5), 2, 1,
-                            boxstyle="round,pad=0.1",
-                            edgecolor='#1976D2', facecolor=color_external,
-                            linewidth=2, linestyle='dashed')
-ax.add_patch(comment_box)
-ax.text(1.5, 3.2, 'Sentry', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(1.5, 2.9, 'Comments', ha='center', va='center', fontsize=8)
-ax.text(1.5, 2.65, '(optional)', ha='center', va='center', fontsize=7, style='italic')
-
-# Arrow: Orchestrator -> Sentry Comments
-arrow9 = FancyArrowPatch((3.5, 3.5), (2.5, 3.0),
-                        arrowstyle='->', mutation_scale=20, linewidth=2,
-                        color='#1976D2', linestyle='dashed')
-ax.add_patch(arrow9)
-ax.text(2.8, 3.4, 'Post', fontsize=8)
-
-# Arrow: Sentry Comments -> Sentry.io
-arrow10 = FancyArrowPatch((1.5, 3.5), (1.5, 7.5),
-                         arrowstyle='->', mutation_scale=20, linewidth=2,
-                         color='#1976D2', linestyle='dashed', alpha=0.4)
-ax.add_patch(arrow10)
-
-# 9. Configuration
-config_box = FancyBboxPatch((7.5, 2.5), 2, 1,
-                           boxstyle="round,pad=0.1",
-                           edgecolor='#616161', facecolor='#F5F5F5', linewidth=2)
-ax.add_patch(config_box)
-ax.text(8.5, 3.2, 'Configuration', ha='center', va='center', fontsize=10, fontweight='bold')
-ax.text(8.5, 2.9, '.env File', ha='center', va='center', fontsize=8)
-ax.text(8.5, 2.65, 'API Keys & Settings', ha='center', va='center', fontsize=7)
+# Boxes, one row per box: position/size in data units, edge/face colours, edge width and
+# style, the bold title as (text, fontsize, y), then the subtitle lines as
+# (text, fontsize, y, font style). Split into one column per attribute below
+BOXES = (
+    # 1. External Services (Top)
+    ((0.5, 7.5, 2, 1), '#1976D2', color_external, 2, False,
+     ('Sentry.io', 11, 8.3), [('Error Tracking', 9, 8.0, 'normal')]),
+    ((7.5, 7.5, 2, 1), '#F57C00', color_external, 2, False,
+     ('Claude API', 11, 8.3), [('Anthropic', 9, 8.0, 'normal')]),
+    # 2. Sentry Client
+    ((0.5, 6, 2, 1), '#E64A19', color_client, 2, False,
+     ('SentryClient', 10, 6.7),
+     [('Fetch Issues', 8, 6.4, 'normal'), ('& Events', 8, 6.15, 'normal')]),
+    # 3. Issue Analyzer
+    ((3.5, 6, 2, 1), '#7B1FA2', color_analyzer, 2, False,
+     ('IssueAnalyzer', 10, 6.7),
+     [('Parse Stack', 8, 6.4, 'normal'), ('Traces', 8, 6.15, 'normal')]),
+    # 4. Orchestrator (Center)
+    ((3.5, 4.2, 3, 1.2), '#388E3C', color_orchestrator, 3, False,
+     ('Orchestrator', 12, 5.1),
+     [('Workflow Coordinator', 9, 4.8, 'normal'),
+      ('• Filter Issues  • Read Files  • Manage Flow', 7, 4.5, 'normal')]),
+    # 5. Local Codebase
+    ((0.5, 4, 2, 1), '#455A64', '#ECEFF1', 2, False,
+     ('Local Codebase', 10, 4.7), [('Source Files', 8, 4.4, 'normal')]),
+    # 6. Claude Agent
+    ((7.5, 4.5, 2, 1.5), '#F57C00', color_claude, 2, False,
+     ('ClaudeAgent', 10, 5.6),
+     [('Build Prompts', 8, 5.3, 'normal'), ('Call Claude API', 8, 5.05, 'normal'),
+      ('Parse Response', 8, 4.8, 'normal')]),
+    # 7. Output Files
+    ((3.5, 2.5, 3, 1), '#C62828', color_output, 2, False,
+     ('Output Files', 10, 3.2), [('JSON + Markdown Proposals', 8, 2.9, 'normal')]),
+    # 8. Sentry Comments (Optional)
+    ((0.5, 2.5, 2, 1), '#1976D2', color_external, 2, True,
+     ('Sentry', 10, 3.2), [('Comments', 8, 2.9, 'normal'), ('(optional)', 7, 2.65, 'italic')]),
+    # 9. Configuration
+    ((7.5, 2.5, 2, 1), '#616161', '#F5F5F5', 2, False,
+     ('Configuration', 10, 3.2),
+     [('.env File', 8, 2.9, 'normal'), ('API Keys & Settings', 7, 2.65, 'normal')]),
+)
+(BOX_XYWH, BOX_STROKES, BOX_FILLS, BOX_STROKE_WIDTHS, BOX_DASHED,
+ BOX_TITLES, BOX_SUBTITLES) = zip(*BOXES)
+
+# Arrows: start/end in data units, head ('->', '<-', '<->'), colour and
+# labels as (x, y, text, font style)
+ARROWS = [
+    dict(start=(1.5, 7.5), end=(1.5, 7.0), head='->', color='#1976D2',
+         labels=[(1.8, 7.25, 'API', 'normal')]),  # Sentry.io -> SentryClient
+    dict(start=(2.5, 6.5), end=(3.5, 6.5), head='->', color='#7B1FA2',
+         labels=[(3.0, 6.7, 'Issues', 'normal')]),  # SentryClient -> IssueAnalyzer
+    dict(start=(4.5, 6.0), end=(4.5, 5.4), head='->', color='#388E3C',
+         labels=[(4.8, 5.7, 'Context', 'normal')]),  # IssueAnalyzer -> Orchestrator
+    dict(start=(3.5, 4.8), end=(2.5, 4.5), head='<-', color='#455A64', dashed=True,
+         labels=[(2.8, 4.3, 'read', 'italic')]),  # Orchestrator -> Codebase (read)
+    dict(start=(6.5, 4.8), end=(7.5, 5.2), head='->', color='#F57C00',
+         labels=[(6.8, 5.2, 'Context +', 'normal'),
+                 (6.8, 4.95, 'Code', 'normal')]),  # Orchestrator -> ClaudeAgent
+    dict(start=(8.5, 6.0), end=(8.5, 7.5), head='<->', color='#F57C00',
+         labels=[(8.8, 6.75, 'API', 'normal')]),  # ClaudeAgent <-> Claude API
+    dict(start=(7.5, 4.8), end=(6.5, 4.8), head='->', color='#F57C00', dashed=True,
+         labels=[(7.0, 5.0, 'Fix', 'normal'),
+                 (7.0, 4.75, 'Proposal', 'normal')]),  # ClaudeAgent -> Orchestrator
+    dict(start=(5, 4.2), end=(5, 3.5), head='->', color='#C62828',
+         labels=[(5.3, 3.85, 'Save', 'normal')]),  # Orchestrator -> Output
+    dict(start=(3.5, 3.5), end=(2.5, 3.0), head='->', color='#1976D2', dashed=True,
+         labels=[(2.8, 3.4, 'Post', 'normal')]),  # Orchestrator -> Sentry Comments
+    dict(start=(1.5, 3.5), end=(1.5, 7.5), head='->', color='#1976D2', dashed=True,
+         opacity=0.4, labels=[]),  # Sentry Comments -> Sentry.io
+]
 
 # Dotted lines from config to components
-ax.plot([8.5, 1.5], [2.5, 6.0], 'k:', linewidth=1, alpha=0.3)
-ax.plot([8.5, 5.0], [2.5, 4.2], 'k:', linewidth=1, alpha=0.3)
-ax.plot([8.5, 8.5], [2.5, 4.5], 'k:', linewidth=1, alpha=0.3)
-
-# Legend
-legend_elements = [
-    mpatches.Patch(facecolor=color_external, edgecolor='black', label='External Services'),
-    mpatches.Patch(facecolor=color_client, edgecolor='black', label='API Clients'),
-    mpatches.Patch(facecolor=color_analyzer, edgecolor='black', label='Analyzers'),
-    mpatches.Patch(facecolor=color_orchestrator, edgecolor='black', label='Orchestration'),
-    mpatches.Patch(facecolor=color_output, edgecolor='black', label='Output'),
-    mlines.Line2D([], [], color='black', linestyle='--', label='Optional Flow'),
+CONFIG_LINKS = [((8.5, 2.5), (1.5, 6.0)), ((8.5, 2.5), (5.0, 4.2)), ((8.5, 2.5), (8.5, 4.5))]
+
+LEGEND = [
+    (color_external, 'External Services'),
+    (color_client, 'API Clients'),
+    (color_analyzer, 'Analyzers'),
+    (color_orchestrator, 'Orchestration'),
+    (color_output, 'Output'),
+    (None, 'Optional Flow'),
 ]
 
-ax.legend(handles=legend_elements, loc='lower center', ncol=3, frameon=True, fontsize=8)
 
-# Footer
-ax.text(5, 0.5, 'Sentry-Claude Autofix • Automated Error Investigation & Fix Proposals',
-        ha='center', va='center', fontsize=9, style='italic', color='#666666')
+def render_boxes():
+    for (x, y, w, h), stroke, fill, width, dashed in zip(
+            BOX_XYWH, BOX_STROKES, BOX_FILLS, BOX_STROKE_WIDTHS, BOX_DASHED, strict=True):
+        bx, by = px(x - PAD, y + h + PAD)
+        attrs = ''
+        if width != 2:
+            attrs += f' stroke-width="{pt(width):.2f}"'
+        if dashed:
+            attrs += DASHED
+        yield (f'<rect x="{bx:.1f}" y="{by:.1f}" width="{(w + 2 * PAD) * SX:.1f}" '
+               f'height="{(h + 2 * PAD) * SY:.1f}" rx="8" ry="8" '
+               f'fill="{fill}" stroke="{stroke}"{attrs}/>')
+
+
+def box_labels():
+    for (x, _, w, _), (title, size, ty), subtitles in zip(
+            BOX_XYWH, BOX_TITLES, BOX_SUBTITLES, strict=True):
+        cx = x + w / 2
+        yield text(cx, ty, title, size, weight='bold', anchor='middle', baseline='central')
+        for label, size, ly, style in subtitles:
+            yield text(cx, ly, label, size, style=style, anchor='middle', baseline='central')
+
+
+# One marker per arrow colour. The marker attributes for each colour and head spec in use
+# are formatted once here, and render_arrow looks them up
+ARROW_HEADS = {
+    '->': ' marker-end="{0}"',
+    '<-': ' marker-start="{0}"',
+    '<->': ' marker-end="{0}" marker-start="{0}"',
+}
+ARROW_COLORS = sorted({a['color'] for a in ARROWS})
+MARKER_ATTRS = {
+    (color, head): ARROW_HEADS[head].format(f'url(#head-{color[1:]})')
+    for color, head in {(a['color'], a['head']) for a in ARROWS}
+}
+
+
+def render_arrow(a):
+    (x1, y1), (x2, y2) = px(*a['start']), px(*a['end'])
+    attrs = MARKER_ATTRS[a['color'], a['head']]
+    if a.get('dashed'):
+        attrs += DASHED
+    if 'opacity' in a:
+        attrs += f' opacity="{a["opacity"]}"'
+    return (f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}" '
+            f'stroke="{a["color"]}"{attrs}/>')
+
+
+def arrow_labels(a):
+    for lx, ly, label_text, style in a['labels']:
+        yield text(lx, ly, label_text, 8, style=style)
+
+
+def render_marker(color):
+    return (f'<marker id="head-{color[1:]}" viewBox="0 0 10 10" refX="10" refY="5" '
+            f'markerWidth="4" markerHeight="4" orient="auto-start-reverse">'
+            f'<path d="M0,0 L10,5 L0,10" fill="none" stroke="{color}" stroke-width="2.5"/></marker>')
+
+
+def render_legend():
+    # Three columns filled top to bottom, like matplotlib's ncol=3. The legend sits above
+    # the data flow note, because matplotlib's lower-centre placement overlapped the footer
+    col_w, row_h, rows = 220, 28, 2
+    left, top = (WIDTH - 3 * col_w) / 2, px(0, 2.25)[1]
+    parts = [f'<rect x="{left - 10:.1f}" y="{top - 10:.1f}" width="{3 * col_w + 20}" '
+             f'height="{rows * row_h + 14}" rx="4" ry="4" fill="white" stroke="#CCCCCC" '
+             f'stroke-width="{pt(1):.2f}"/>']
+    for i, (fill, label) in enumerate(LEGEND):
+        x, y = left + (i // rows) * col_w, top + (i % rows) * row_h
+        if fill:
+            parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="28" height="16" '
+                         f'fill="{fill}" stroke="black" stroke-width="{pt(1):.2f}"/>')
+        else:
+            parts.append(f'<line x1="{x:.1f}" y1="{y + 8:.1f}" x2="{x + 28:.1f}" y2="{y + 8:.1f}" '
+                         f'stroke="black" stroke-width="{pt(1.5):.2f}" stroke-dasharray="6,3"/>')
+        parts.append(f'<text x="{x + 36:.1f}" y="{y + 8:.1f}" font-size="{pt(8):.1f}" '
+                     f'dominant-baseline="central">{label}</text>')
+    return group('legend', parts)
+
+
+def render_footer():
+    note = 'Data Flow: Sentry Issues → Analysis → Claude AI → Fix Proposals → Output'
+    # Approximate the text width to size the rounded note box around it
+    w, h = len(note) * pt(8) * 0.55 + 2 * pt(8) * 0.5, pt(8) * 2
+    nx, ny = px(5, 1.3)
+    parts = [
+        f'<rect x="{nx - w / 2:.1f}" y="{ny - h / 2:.1f}" width="{w:.1f}" height="{h:.1f}" '
+        f'rx="6" ry="6" fill="#FFFFCC" stroke="#999999" stroke-width="{pt(1):.2f}"/>',
+        text(5, 1.3, note, 8, anchor='middle', baseline='central'),
+        text(5, 0.5, 'Sentry-Claude Autofix • Automated Error Investigation & Fix Proposals', 9,
+             style='italic', color='#666666', anchor='middle', baseline='central'),
+    ]
+    return group('footer', parts)
+
+
+def render_svg():
+    links = [
+        f'<line x1="{px(*s)[0]:.1f}" y1="{px(*s)[1]:.1f}" x2="{px(*e)[0]:.1f}" y2="{px(*e)[1]:.1f}"/>'
+        for s, e in CONFIG_LINKS
+    ]
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" '
+        f'viewBox="0 0 {WIDTH} {HEIGHT}" font-family="DejaVu Sans, Arial, sans-serif">',
+        '<defs>', *map(render_marker, ARROW_COLORS), '</defs>',
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="white"/>',
+        # Title
+        text(5, 9.5, 'Sentry-Claude Autofix System Architecture', 18, weight='bold',
+             anchor='middle', baseline='hanging'),
+        # Shapes are batched into one layer each, labels drawn on top. Line widths are the
+        # matplotlib linewidths in points
+        group('boxes', render_boxes(), f' stroke-width="{pt(2):.2f}"'),
+        # Config links go over the box fills, as matplotlib drew lines above patches
+        group('config-links', links,
+              f' stroke="black" stroke-width="{pt(1):.2f}" stroke-dasharray="1,3"'
+              f' stroke-opacity="0.3"'),
+        group('arrows', map(render_arrow, ARROWS), f' stroke-width="{pt(2):.2f}"'),
+        group('labels', [*box_labels(),
+                         *chain.from_iterable(map(arrow_labels, ARROWS))]),
+        render_legend(),
+        render_footer(),
+        '</svg>',
+        '',
+    ])
+
 
-# Add data flow annotations
-ax.text(5, 1.3, 'Data Flow: Sentry Issues → Analysis → Claude AI → Fix Proposals → Output',
-        ha='center', va='center', fontsize=8,
-        bbox=dict(boxstyle='round,pad=0.5', facecolor='#FFFFCC', edgecolor='#999999'))
+if svg_current:
+    print(f"✅ Systems diagram up to date: {svg_path}")
+else:
+    svg_path.write_text(render_svg(), encoding='utf-8')
+    stamp(svg_path).write_text(source_hash)
+    print(f"✅ Systems diagram generated: {svg_path}")
 
-plt.tight_layout()
-plt.savefig('systems-diagram.png', dpi=300, bbox_inches='tight', facecolor='white')
-print("✅ Systems diagram generated: systems-diagram.png")
+# cairosvg (and the cairo/Pillow stack behind it) is only needed for the PNG
+try:
+    from cairosvg import svg2png
+except (ImportError, OSError) as exc:
+    # OSError: cairosvg is installed but cairocffi cannot load the native libcairo
+    reason = str(exc).splitlines()[0]
+    print(f"⚠️  {png_path} not regenerated: install cairosvg and libcairo ({reason})",
+          file=sys.stderr)
+else:
+    svg2png(url=str(svg_path), write_to=str(png_path),
+            output_width=WIDTH * DPI // 100)
+    stamp(png_path).write_text(source_hash)
+    print(f"✅ Systems diagram generated: {png_path}")